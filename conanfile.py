@@ -12,15 +12,400 @@ import os
 import sys
 import subprocess
 import shutil
+import stat
+import tempfile
+import tarfile
+import urllib.request
+import ctypes
+import fnmatch
+import functools
+import hashlib
+import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from conan import ConanFile
 from conan.errors import ConanInvalidConfiguration, ConanException
 from conan.tools.files import get, copy, rm, chdir, load
-from conan.tools.build import can_run, cross_building
+from conan.tools.build import build_jobs, can_run, cross_building
 from conan.tools.gnu import Autotools, AutotoolsDeps
-from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
+from conan.tools.env import Environment, VirtualBuildEnv, VirtualRunEnv
 from conan.tools.info import check_min_cppstd
 
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for the .tar.zst source mirror
+    zstandard = None
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) from linux/fs.h
+FICLONE = 0x40049409
+# clonefile(2) flag from sys/clonefile.h: don't follow a symlink at src
+CLONE_NOFOLLOW = 0x0001
+# CopyFileExW flag from winbase.h: copy a symlink as a symlink
+COPY_FILE_COPY_SYMLINK = 0x00000800
+
+# Cached Trivy/Syft results older than this are re-scanned to pick up new advisories
+SCAN_CACHE_TTL = 24 * 60 * 60
+SCAN_CACHE_MAX_ENTRIES = 64
+
+# Seconds without data before the source mirror is abandoned for python.org
+SOURCE_MIRROR_TIMEOUT = 60
+
+# Upstream sha256 of the official source tarballs, keyed by version
+SOURCE_SHA256 = {
+    "3.12.7": "73ac8fe780227bf371add8373c3079f42a0dc62deff8d612cd15a618082ab623",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _clonefile():
+    """Resolve clonefile(2) from libSystem on macOS (None if unavailable)"""
+    try:
+        libsystem = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+        func = libsystem.clonefile
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    func.restype = ctypes.c_int
+    return func
+
+
+@functools.lru_cache(maxsize=None)
+def _copy_file_ex():
+    """Resolve CopyFileExW from kernel32 on Windows (None if unavailable)"""
+    try:
+        func = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                     ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Copy-on-write clone of a single file; False if the filesystem can't"""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            if os.path.lexists(dst):
+                os.unlink(dst)
+            return False
+        shutil.copystat(src, dst)
+        return True
+    if sys.platform == "darwin":
+        clonefile = _clonefile()
+        if clonefile is None:
+            return False
+        return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+    return False
+
+
+def _fast_transfer(src: str, dst: str, allow_symlink: bool = False,
+                   allow_hardlink: bool = True) -> str:
+    """
+    Stage a file into dst with the cheapest available mechanism.
+
+    Tries reflink (FICLONE / clonefile), then a hardlink when src and dst share
+    a device, then a symlink if allowed, and finally a plain copy.
+    Returns the name of the mechanism used.
+    """
+    dst_dir = os.path.dirname(dst)
+    os.makedirs(dst_dir, exist_ok=True)
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    if _reflink(src, dst):
+        return "reflink"
+    try:
+        if allow_hardlink and os.stat(src).st_dev == os.stat(dst_dir).st_dev:
+            os.link(os.path.realpath(src), dst)  # link(2) doesn't dereference symlinks on Linux
+            return "hardlink"
+    except OSError:
+        pass
+    if allow_symlink:
+        try:
+            os.symlink(os.path.abspath(src), dst)
+            return "symlink"
+        except OSError:
+            pass
+    _kernel_copy(src, dst)
+    return "copy"
+
+
+def _kernel_copy(src: str, dst: str):
+    """Full copy that stays in-kernel where possible (copy_file_range / CopyFileExW)"""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        # Short copy (e.g. size-lying procfs/sysfs files): same as unsupported
+                        raise OSError(f"copy_file_range stopped short on {src}")
+                    remaining -= sent
+        except OSError:
+            pass  # e.g. EXDEV/ENOSYS on older kernels; copy2 below truncates and retries
+        else:
+            shutil.copystat(src, dst)
+            return
+    if sys.platform == "win32":
+        copy_file_ex = _copy_file_ex()
+        if copy_file_ex is not None and copy_file_ex(src, dst, None, None, None, COPY_FILE_COPY_SYMLINK):
+            return
+    shutil.copy2(src, dst)
+
+
+def _copy_tree(src_root: str, dst_root: str):
+    """
+    Reflink-aware replacement for shutil.copytree(..., dirs_exist_ok=True).
+
+    On macOS a fresh destination is cloned in a single clonefile(2) call.
+    Otherwise the tree is walked with os.scandir, symlinks are recreated
+    as symlinks when SYMLINKS_SUPPORTED (else their targets are copied), and
+    files go through _fast_transfer without hard/symlinks.
+    """
+    if sys.platform == "darwin" and not os.path.lexists(dst_root):
+        clonefile = _clonefile()
+        if clonefile is not None and clonefile(os.fsencode(src_root), os.fsencode(dst_root),
+                                               CLONE_NOFOLLOW) == 0:
+            return
+    stack = [(src_root, dst_root)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                dst = os.path.join(dst_dir, entry.name)
+                if SYMLINKS_SUPPORTED and entry.is_symlink():
+                    if os.path.lexists(dst):
+                        os.unlink(dst)
+                    os.symlink(os.readlink(entry.path), dst, target_is_directory=entry.is_dir())
+                    continue
+                if entry.is_dir():
+                    stack.append((entry.path, dst))
+                else:
+                    _fast_transfer(entry.path, dst, allow_hardlink=False)
+
+
+def _compile_globs(*patterns) -> tuple:
+    """Precompile fnmatch patterns into regex matchers, once instead of per file name"""
+    return tuple(re.compile(fnmatch.translate(pattern)).match for pattern in patterns)
+
+
+# Staging filters shared by every package()/source() walk
+# Static libs [web:69], plus bytecode caches that are regenerated on first import
+_STDLIB_EXCLUDES = _compile_globs("*.a", "*.pyc", "*.pyo", "__pycache__")
+_SOURCE_CACHE_EXCLUDES = _compile_globs(".extracted")
+
+
+def _scan_tree(src_root: str, rules, excludes=(), recursive: bool = True):
+    """
+    Walk src_root once with os.scandir, classifying each file by rule.
+
+    rules is a sequence of (fnmatch pattern, dst_dir); a file goes to the
+    first rule whose pattern matches its name, keeping its path relative to
+    src_root. excludes are matchers from _compile_globs, applied to file names
+    and to directory names (pruning the whole subtree). Returns (files, links)
+    lists of (src, dst) pairs, with symlinks split out so they can be
+    recreated instead of copied. A missing src_root stages nothing, like copy().
+    """
+    rules = [(_compile_globs(pattern)[0], dst_dir) for pattern, dst_dir in rules]
+    files, links = [], []
+    if not os.path.isdir(src_root):
+        return files, links
+    stack = [(src_root, "")]
+    while stack:
+        src_dir, rel_dir = stack.pop()
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if any(match(entry.name) for match in excludes):
+                    continue
+                # Directory symlinks are recreated as links, or walked into when links can't be made
+                if entry.is_dir(follow_symlinks=False) or \
+                        (not SYMLINKS_SUPPORTED and entry.is_symlink() and entry.is_dir()):
+                    if recursive:
+                        stack.append((entry.path, os.path.join(rel_dir, entry.name)))
+                    continue
+                for match, dst_dir in rules:
+                    if match(entry.name):
+                        dst = os.path.join(dst_dir, rel_dir, entry.name)
+                        (links if entry.is_symlink() else files).append((entry.path, dst))
+                        break
+    return files, links
+
+
+def _classify_and_stage(src_root: str, rules, excludes=(), recursive: bool = True,
+                        allow_symlink: bool = False, allow_hardlink: bool = True,
+                        workers: int = 1) -> int:
+    """Stage every file under src_root matching rules in a single pass; returns entry count"""
+    files, links = _scan_tree(src_root, rules, excludes, recursive)
+    staged = {src for src, _ in files} | {src for src, _ in links}
+    preserved = 0
+    for src, dst in links:
+        if not os.path.exists(src):
+            continue  # Dangling link: nothing to stage, and it would point outside the package
+        target = os.readlink(src)
+        is_dir_link = os.path.isdir(src)
+        if not SYMLINKS_SUPPORTED or (not is_dir_link and
+                                      os.path.normpath(os.path.join(os.path.dirname(src), target))
+                                      not in staged):
+            files.append((src, dst))  # Can't link, or target isn't staged; materialize instead
+            continue
+        # Directory links and aliases of staged files (e.g. libpython soname links) stay symlinks
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.symlink(target, dst, target_is_directory=is_dir_link)
+        preserved += 1
+    if workers > 1 and len(files) > workers:
+        srcs, dsts = zip(*files)
+        # Threads: the per-file work is syscall-bound and releases the GIL
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Drain the iterator so worker exceptions propagate
+            for _ in pool.map(_fast_transfer, srcs, dsts, repeat(allow_symlink),
+                              repeat(allow_hardlink)):
+                pass
+    else:
+        for src, dst in files:
+            _fast_transfer(src, dst, allow_symlink, allow_hardlink)
+    return len(files) + preserved
+
+
+def _tree_hash(root: str, excludes=()) -> str:
+    """
+    Merkle-style digest of a tree without reading file contents.
+
+    Files contribute (relpath, size, mtime_ns); symlinks contribute their
+    target instead, made relative to root when it points inside it, so links
+    recreated by every package() run hash the same.
+    """
+    root = os.path.abspath(root)
+    entries = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                rel = os.path.relpath(entry.path, root)
+                if rel in excludes:
+                    continue
+                if entry.is_symlink():
+                    target = os.readlink(entry.path)
+                    if os.path.isabs(target) and os.path.commonpath([root, target]) == root:
+                        target = os.path.join("<root>", os.path.relpath(target, root))
+                    entries.append((rel, f"->{target}"))
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    entries.append((rel, f"{st.st_size}\0{st.st_mtime_ns}"))
+    digest = hashlib.sha256()
+    for rel, meta in sorted(entries):
+        digest.update(f"{rel}\0{meta}\n".encode())
+    return digest.hexdigest()
+
+
+def _prune_scan_cache(cache_dir: Path, now=None):
+    """Drop expired scan results and keep at most SCAN_CACHE_MAX_ENTRIES of the rest"""
+    now = time.time() if now is None else now
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            mtime = path.stat().st_mtime
+            if now - mtime >= SCAN_CACHE_TTL:
+                path.unlink()
+            else:
+                entries.append((mtime, path))
+        except OSError:
+            continue  # Removed concurrently by another build
+    entries.sort(reverse=True)
+    for _, path in entries[SCAN_CACHE_MAX_ENTRIES:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class _HashingReader:
+    """File-like wrapper that sha256-hashes every byte read through it"""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+def _extract_zst(fileobj, dest: str) -> str:
+    """
+    Stream-extract a .tar.zst from a non-seekable file object (no temp file).
+
+    Returns the sha256 of the compressed stream, hashed while extracting.
+    """
+    hashed = _HashingReader(fileobj)
+    reader = zstandard.ZstdDecompressor().stream_reader(hashed)
+    with tarfile.open(fileobj=reader, mode="r|") as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest, filter="data")
+        else:
+            tar.extractall(dest)
+    while hashed.read(1 << 20):
+        pass  # Trailing frame bytes the tar reader stopped short of
+    return hashed.digest.hexdigest()
+
+
+def _write_zst(src_dir: str, out_path: str, excludes=()) -> str:
+    """Recompress an extracted tree as a multithreaded zstd tarball, atomically; returns its sha256"""
+    partial = f"{out_path}.partial"
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(partial, "wb") as fh, cctx.stream_writer(fh) as writer, \
+            tarfile.open(fileobj=writer, mode="w|") as tar:
+        with os.scandir(src_dir) as it:
+            for entry in sorted(it, key=lambda e: e.name):
+                if entry.name not in excludes:
+                    tar.add(entry.path, arcname=entry.name)
+    os.replace(partial, out_path)
+    digest = hashlib.sha256()
+    with open(out_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink_copy(source: str, dest: str, target_is_directory: bool = False):
+    """os.symlink-compatible stand-in that materializes a reflinked copy"""
+    if target_is_directory:
+        _copy_tree(source, dest)
+    else:
+        _fast_transfer(source, dest, allow_hardlink=False)
+
+
+def _probe_symlinks() -> bool:
+    """Check once whether this process may create symlinks (fails on unprivileged Windows)"""
+    probe_dir = tempfile.mkdtemp(prefix="cpython-tool-symlink-")
+    try:
+        os.symlink(probe_dir, os.path.join(probe_dir, "probe"), target_is_directory=True)
+        return True
+    except OSError:
+        return False
+    finally:
+        shutil.rmtree(probe_dir, ignore_errors=True)
+
+
+SYMLINKS_SUPPORTED = _probe_symlinks()
+# Bound once so per-entry linking never goes through a failing os.symlink + except
+_do_link = os.symlink if SYMLINKS_SUPPORTED else _reflink_copy
+
+
 class CPythonTool(ConanFile):
     """
     CPython Tool Package - Builds CPython from source for use as Conan tool_requires.
@@ -39,13 +424,15 @@ class CPythonTool(ConanFile):
         "shared": [True, False],
         "fips": [True, False],  # Optional FIPS mode [web:51]
         "optimize": ["0", "1", "2", "3"],  # Python optimization level
-        "enable_zero_copy": [True, False]  # Enable zero-copy symlink support
+        "enable_zero_copy": [True, False],  # Enable zero-copy symlink support
+        "enable_sbom": [True, False]  # Syft SBOM, audited by Trivy [web:17]
     }
     default_options = {
         "shared": False,
         "fips": False,
         "optimize": "2",
-        "enable_zero_copy": True
+        "enable_zero_copy": True,
+        "enable_sbom": False
     }
 
     requires = "zlib/[>=1.2.11 <2.0]@conan/stable"  # Core dep for CPython [web:69]
@@ -65,42 +452,115 @@ class CPythonTool(ConanFile):
         if self.options.shared and self.settings.os == "Windows":
             self.options["zlib"].shared = True
 
+    def validate(self):
+        self._py_tgz_sha256  # Reject unpinned versions before anything is fetched
+
+    @property
+    def _py_srcdir(self) -> str:
+        return f"Python-{self.version}"
+
+    @property
+    def _py_tgz_url(self) -> str:
+        return f"https://www.python.org/ftp/python/{self.version}/{self._py_srcdir}.tgz"
+
+    @property
+    def _py_tgz_sha256(self) -> str:
+        try:
+            return SOURCE_SHA256[str(self.version)]
+        except KeyError:
+            raise ConanInvalidConfiguration(
+                f"No pinned source sha256 for CPython {self.version}; add it to SOURCE_SHA256") from None
+
     def _create_symlink(self, source: str, dest: str, is_directory: bool = False):
         """Cross-platform symlink creation for zero-copy support"""
-        # Remove existing if needed
-        if os.path.exists(dest) or os.path.islink(dest):
-            if os.path.islink(dest):
-                current_target = os.readlink(dest)
-                source_abs = os.path.abspath(source)
-                dest_abs = os.path.abspath(current_target)
-                if source_abs == dest_abs:
-                    return  # Already correct
-                os.unlink(dest)
-            else:
+        # Remove existing if needed; one lstat instead of exists/islink/abspath probes
+        try:
+            st = os.lstat(dest)
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if not stat.S_ISLNK(st.st_mode):
                 # Non-symlink exists
                 self.output.warn(f"{dest} exists and is not a symlink, skipping")
                 return
+            if os.readlink(dest) == os.fspath(source):
+                return  # Already correct
+            os.unlink(dest)
         
-        try:
-            if self.settings.os == "Windows":
-                if is_directory:
-                    os.symlink(source, dest, target_is_directory=True)
-                else:
-                    os.symlink(source, dest)
-            else:
-                os.symlink(source, dest, target_is_directory=is_directory)
+        _do_link(source, dest, target_is_directory=is_directory)
+        if SYMLINKS_SUPPORTED:
             self.output.info(f"Created symlink: {dest} -> {source}")
-        except OSError as e:
-            self.output.warn(f"Symlink failed ({e}), using copy fallback")
-            if is_directory:
-                shutil.copytree(source, dest, dirs_exist_ok=True)
-            else:
-                shutil.copy2(source, dest)
-            self.output.warn("⚠️  Used copy instead of symlink (not zero-copy)")
+        else:
+            self.output.warn(f"⚠️  Copied {source} to {dest}: symlinks unavailable (not zero-copy)")
+
+    def _source_cache_dir(self) -> Path:
+        """Per-version cache of the extracted upstream source tree, next to Conan's download cache"""
+        conan_home = Path(os.environ.get("CONAN_HOME")
+                          or os.environ.get("CONAN_USER_HOME", Path.home() / ".conan2"))
+        return conan_home / "sources" / f"cpython-{self.version}"
+
+    def _source_mirror_url(self):
+        """URL of the zstd-recompressed source on the configured mirror, if any"""
+        mirror = self.conf.get("user.cpython-tool:source_mirror")
+        if not mirror or zstandard is None:
+            return None
+        return f"{mirror.rstrip('/')}/{self._py_srcdir}.tar.zst"
+
+    def _fetch_source_mirror(self, staging: str) -> bool:
+        """Try the .tar.zst mirror, streaming download straight into extraction"""
+        url = self._source_mirror_url()
+        if url is None:
+            return False
+        expected = self.conf.get("user.cpython-tool:source_mirror_sha256")
+        if not expected:
+            self.output.warn("user.cpython-tool:source_mirror_sha256 is not set; not trusting the source mirror")
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=SOURCE_MIRROR_TIMEOUT) as response:
+                actual = _extract_zst(response, staging)
+            if actual != expected.lower():
+                raise ConanException(f"sha256 mismatch for {url}: expected {expected}, got {actual}")
+        except (OSError, ValueError, tarfile.TarError, zstandard.ZstdError, ConanException) as e:
+            self.output.warn(f"Source mirror unusable ({e}), falling back to {self._py_tgz_url}")
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+            return False
+        self.output.info(f"Fetched and verified CPython sources from {url}")
+        return True
+
+    def _write_source_mirror(self, staging: str):
+        """Recompress a verified upstream extraction for publishing to the mirror"""
+        if self._source_mirror_url() is None:
+            return
+        out_path = self._source_cache_dir().parent / f"{self._py_srcdir}.tar.zst"
+        digest = _write_zst(staging, str(out_path), excludes=(".extracted",))
+        self.output.info(f"Wrote {out_path} (sha256 {digest}); publish it to the source mirror "
+                         f"and pin user.cpython-tool:source_mirror_sha256 to speed up source()")
 
     def source(self):
-        get(self, f"https://www.python.org/ftp/python/{self.version}/Python-{self.version}.tgz",
-            strip_root=True)  # Fetch official sources [web:106][attached_file:1]
+        sha256 = self._py_tgz_sha256
+        cache_dir = self._source_cache_dir()
+        marker = cache_dir / ".extracted"
+        if marker.is_file() and marker.read_text().strip() == sha256:
+            self.output.info(f"Using cached CPython sources from {cache_dir}")
+        else:
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            staging = tempfile.mkdtemp(prefix=f"{cache_dir.name}-", dir=cache_dir.parent)
+            if not self._fetch_source_mirror(staging):
+                get(self, self._py_tgz_url, sha256=sha256, destination=staging,
+                    strip_root=True)  # Fetch official sources [web:106][attached_file:1]
+                self._write_source_mirror(staging)
+            Path(staging, ".extracted").write_text(sha256)
+            if cache_dir.exists():
+                shutil.rmtree(cache_dir)  # Stale or partial extraction
+            try:
+                os.rename(staging, cache_dir)
+            except OSError:
+                # A concurrent source() populated the cache first
+                shutil.rmtree(staging, ignore_errors=True)
+        # The build writes into the source tree, so never hardlink back to the cache
+        _classify_and_stage(str(cache_dir), [("*", self.source_folder)], excludes=_SOURCE_CACHE_EXCLUDES,
+                            allow_hardlink=False, workers=build_jobs(self))
         # Apply patches if any: load(self, "patches/fix.patch"); self.patch("patches/fix.patch")
 
     def generate(self):
@@ -114,65 +574,146 @@ class CPythonTool(ConanFile):
             deps.generate()
         self.conf_info.update({"tools.python:optimize": self.options.optimize})
 
+    def _pcbuild_platform(self):
+        """(build.bat -p platform, PCbuild output dir) for the target arch"""
+        return {
+            "x86": ("Win32", "win32"),
+            "armv8": ("ARM64", "arm64"),
+        }.get(str(self.settings.arch), ("x64", "amd64"))
+
     def build(self):
         if self.settings.os in ["Linux", "FreeBSD"]:
             autotools = Autotools(self)
             with chdir(self, self.source_folder):
+                release = self.settings.build_type == "Release"
                 args = [
                     "--prefix=/usr/local",  # Standard prefix
-                    "--enable-optimizations",
+                    # PGO roughly triples build time; only worth it for release interpreters
+                    "--enable-optimizations" if release else "--disable-optimizations",
                     "--with-ensurepip=no",
                     f"--enable-shared={'--disable-shared' if not self.options.shared else ''}",
                     "--enable-loadable-sqlite-extensions"
                 ]
+                if release and self.settings.compiler in ("clang", "apple-clang"):
+                    # ThinLTO links ~2x faster than full LTO; CPython rejects it under gcc
+                    args.append("--with-lto=thin")
                 if self.settings.arch == "armv8":
                     args.append("--with-system-expat")  # Cross-build aids [web:117]
                 if self.options.fips:
                     args.append("--enable-fips")
-                autotools.configure(args=args)
-                autotools.make()
+                # Append -O<optimize> to the environment's CFLAGS rather than replacing
+                # them on the configure line; Debug builds keep their own flags
+                cflags = Environment()
+                if release:
+                    cflags.append("CFLAGS", f"-O{self.options.optimize}")
+                with cflags.vars(self).apply():
+                    autotools.configure(args=args)
+                autotools.make()  # Parallel per tools.build:jobs
                 autotools.install()
         elif self.settings.os == "Windows":
             # MSVC build: use PCbuild/build.bat for simplicity [web:103]
-            self.run(f"cd PCbuild && build.bat -p {self.settings.compiler.version} -t {self.settings.build_type}")
+            platform, _ = self._pcbuild_platform()
+            config = "Debug" if self.settings.build_type == "Debug" else "Release"
+            # Keep externals (OpenSSL, Tcl/Tk, ...) beside the source cache so -e
+            # only downloads them on a cold cache
+            externals = Environment()
+            externals.define("EXTERNALS_DIR", str(self._source_cache_dir().parent / "cpython-externals"))
+            with externals.vars(self).apply():
+                # -e: fetch externals into EXTERNALS_DIR; -m: keep MSBuild /m (build.bat's default)
+                self.run(f"cd PCbuild && build.bat -e -m -p {platform} -c {config}")
         elif self.settings.os == "Macos":
+            zlib_inc = self.dependencies["zlib"].cpp_info.includedirs[0]
             with chdir(self, self.source_folder):
                 env_vars = os.environ.copy()
-                env_vars["CPPFLAGS"] = f'-I{self.deps_cpp_info["zlib"].include_paths[0]}'
+                env_vars["CPPFLAGS"] = f"-I{zlib_inc}"
                 self.run("./configure --enable-framework --enable-shared", env=env_vars)
                 self.run("make", env=env_vars)
                 self.run("make install", env=env_vars)
         logger = self.output  # Assume self.output
         logger.info("CPython {} built successfully".format(self.version))
 
-        if self.options.enable_sbom:  # Security integration [web:17]
-            self._generate_sbom()
+    def _generate_sbom(self, sbom_path: str):
+        syft_bin = self.dependencies["syft"].bin_path  # From build_requires if added
+        cmd = [syft_bin, "packages", f"dir:{self.package_folder}", "-o", f"cyclonedx-json={sbom_path}"]
+        self.run(" ".join(cmd))
+        with open(sbom_path, "rb") as f:
+            self.output.info(f"SBOM sha256: {hashlib.sha256(f.read()).hexdigest()}")
+
+    def _scan_cache_dir(self) -> Path:
+        """Results of previous Trivy/Syft runs, keyed by staged tree hash"""
+        cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return cache_home / "cpython-tool" / "scans"
+
+    def _security_scan(self):
+        """
+        Scan the staged package with a single filesystem traversal.
 
-    def _generate_sbom(self):
-        if can_run(self):
-            syft_bin = self.dependencies["syft"].bin_path  # From build_requires if added
-            cmd = [syft_bin, "packages", ".", "-o", "cyclonedx-json=sbom.json"]
-            self.run(" ".join(cmd))
-            with open("sbom.json") as f:
-                self.info["sbom_hash"] = hashlib.sha256(f.read().encode()).hexdigest()  # Assume hashlib
+        With SBOM generation enabled, Syft walks the tree once and Trivy audits
+        the resulting CycloneDX document instead of re-walking the package.
+        A passing result is reused for a bit-identical tree within SCAN_CACHE_TTL.
+        """
+        if not can_run(self):
+            return
+        sbom_enabled = bool(self.options.enable_sbom)  # Security integration [web:17]
+        sbom_path = os.path.join(self.package_folder, "sbom.json")
+        # The two modes run different scanners, so one never stands in for the other
+        mode = "sbom-vuln" if sbom_enabled else "fs"
+        tree_hash = _tree_hash(self.package_folder, excludes=("sbom.json",))
+        cache_file = self._scan_cache_dir() / f"{tree_hash}-{mode}.json"
+        try:
+            fresh = time.time() - cache_file.stat().st_mtime < SCAN_CACHE_TTL
+            cached = json.loads(cache_file.read_text()) if fresh else None
+        except (OSError, ValueError):
+            cached = None
+        if cached is not None and cached.get("mode") == mode:
+            if sbom_enabled:
+                Path(sbom_path).write_text(cached["sbom"])
+            self.output.info(f"Reusing security scan results from {cache_file}")
+            return
+
+        trivy_bin = self.dependencies["trivy"].bin_path
+        if sbom_enabled:
+            self._generate_sbom(sbom_path)
+            # An SBOM only carries package inventory: vulnerabilities are scanned,
+            # but the secret scanning `trivy fs` does by default is not
+            cmd = [trivy_bin, "sbom", sbom_path, "--scanners", "vuln"]
+        else:
+            cmd = [trivy_bin, "fs", self.package_folder]
+        cmd += ["--exit-code", "1", "--vuln-type", "os,library"]
+        self.run(" ".join(cmd))  # Raises on findings, so only passing scans are cached
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        record = {"trivy": "passed", "mode": mode,
+                  "sbom": Path(sbom_path).read_text() if sbom_enabled else None}
+        partial = cache_file.with_suffix(".partial")
+        partial.write_text(json.dumps(record))
+        os.replace(partial, cache_file)
+        _prune_scan_cache(cache_file.parent)
 
     def package(self):
         """Package CPython binaries, libraries, and stdlib with zero-copy support"""
-        # Copy binaries/libs [web:111]
+        # Stage binaries/libs via reflink/hardlink instead of copying [web:111]; never
+        # symlink into the build folder, only the cpython-toolchain links below may be links
+        workers = build_jobs(self)
+        bin_dir = os.path.join(self.package_folder, "bin")
+        lib_dir = os.path.join(self.package_folder, "lib")
         if self.settings.os != "Windows":
-            copy(self, "python", dst=os.path.join(self.package_folder, "bin"), 
-                 src="usr/local/bin")
-            copy(self, "*.so*", dst=os.path.join(self.package_folder, "lib"), 
-                 src="usr/local/lib", symlinks=True)
+            _classify_and_stage(os.path.join(self.build_folder, "usr/local/bin"),
+                                [("python", bin_dir)], recursive=False)
+            _classify_and_stage(os.path.join(self.build_folder, "usr/local/lib"),
+                                [("*.so*", lib_dir)], recursive=False)
         else:
-            copy(self, "python.exe", dst=os.path.join(self.package_folder, "bin"), 
-                 src="PCbuild/amd64")
-            copy(self, "*.pyd", dst=os.path.join(self.package_folder, "lib"), 
-                 src="PCbuild/amd64")
+            # One pass over PCbuild output dispatches both the interpreter and extensions
+            _, out_dir = self._pcbuild_platform()
+            _classify_and_stage(os.path.join(self.build_folder, "PCbuild", out_dir),
+                                [("python.exe", bin_dir), ("*.pyd", lib_dir)],
+                                recursive=False)
         
-        # Stdlib
-        copy(self, "*", dst=os.path.join(self.package_folder, "lib/python3.12"), 
-             src="lib/python3.12", exclude="*.a")  # Exclude static [web:69]
+        # Stdlib: single os.scandir walk, staged across a worker pool
+        staged = _classify_and_stage(os.path.join(self.build_folder, "lib/python3.12"),
+                                     [("*", os.path.join(self.package_folder, "lib/python3.12"))],
+                                     excludes=_STDLIB_EXCLUDES, workers=workers)
+        self.output.info(f"Staged {staged} stdlib files")
         
         # Create zero-copy toolchain structure if enabled
         if self.options.enable_zero_copy:
@@ -187,21 +728,16 @@ class CPythonTool(ConanFile):
                 if os.path.exists(source_item):
                     self._create_symlink(source_item, dest_item, is_directory=True)
         
-        if hasattr(self.options, 'enable_sbom') and self.options.enable_sbom:
-            copy(self, "sbom.json", dst=self.package_folder, keep_path=False)
-
-        # Trivy scan [web:17]
-        if can_run(self):
-            trivy_bin = self.dependencies["trivy"].bin_path
-            cmd = [trivy_bin, "fs", self.package_folder, "--exit-code", "1", "--vuln-type", "os,library"]
-            self.run(" ".join(cmd))
+        # SBOM + Trivy scan [web:17]
+        self._security_scan()
 
     def package_info(self):
         """Package info with zero-copy CPython toolchain exposure"""
         self.cpp_info.set_property("pkg_name", "python")
-        bin_dir = Path(self.package_folder) / "bin"
+        pkg = Path(self.package_folder)
+        bin_dir = pkg / "bin"
         self.cpp_info.bindirs = [str(bin_dir)]
-        self.cpp_info.libdirs = [str(Path(self.package_folder) / "lib")]
+        self.cpp_info.libdirs = [str(pkg / "lib")]
         
         interpreter = "python.exe" if self.settings.os == "Windows" else "python"
         python_exe = bin_dir / interpreter
@@ -212,17 +748,17 @@ class CPythonTool(ConanFile):
         })
         
         # Build/run env for tool use [web:72]
-        self.buildenv_info.define_path("PYTHONHOME", str(self.package_folder))
-        self.runenv_info.define_path("PYTHONHOME", str(self.package_folder))
+        self.buildenv_info.define_path("PYTHONHOME", str(pkg))
+        self.runenv_info.define_path("PYTHONHOME", str(pkg))
         
         # Zero-copy toolchain path for consumers
         if self.options.enable_zero_copy:
-            toolchain_root = os.path.join(self.package_folder, self.toolchain_path)
-            self.buildenv_info.define_path("PYTHON_ROOT", toolchain_root)
-            self.runenv_info.define_path("PYTHON_ROOT", toolchain_root)
+            toolchain_root = pkg / self.toolchain_path
+            self.buildenv_info.define_path("PYTHON_ROOT", str(toolchain_root))
+            self.runenv_info.define_path("PYTHON_ROOT", str(toolchain_root))
             
             # Add toolchain bin to PATH
-            toolchain_bin = os.path.join(toolchain_root, "bin")
+            toolchain_bin = str(toolchain_root / "bin")
             self.buildenv_info.append_path("PATH", toolchain_bin)
             self.runenv_info.append_path("PATH", toolchain_bin)
         